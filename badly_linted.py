@@ -1,18 +1,30 @@
+import ast
+import functools
+import itertools
+from collections import deque
 import os,sys,json
 from typing import List,Dict,Optional,Union,Any
 import random
+import re
 import time
 
+# Regex patterns are compiled once, from raw strings, at import time
+_FLOAT_RE = re.compile(r"\d+\.\d+")
+
 
-def   calculate_stuff(x,y,z):
+def   calculate_stuff(x,y,z,verbose=False):
     """this function does stuff"""
     result=x+y*z
-    if result>100:
-        print("big number!")
-        return result
-    else:
-            print("small number")
-            return result
+    if verbose:
+        print("big number!" if result>100 else "small number")
+    return result
+
+
+# Exact-type dispatch table for BadClass.process_data
+_PROCESS_DISPATCH = {
+    str: str.upper,
+    int: lambda item: item * 2,
+}
 
 
 class  BadClass:
@@ -21,50 +33,43 @@ class  BadClass:
         self.value=value
     
     def process_data(self,data:List)->Dict:
-        """Process some data badly"""
-        output={}
-        for i in range(len(data)):
-            item=data[i]
-            if type(item)==str:
-                output[i]=item.upper()
-            elif type(item)==int:
-                output[i]=item*2
-            else:
-                output[i]=str(item)
-        return output
+        """Process data with a single type lookup per item"""
+        item_type = type
+        # All-int input: double in C with no per-item dispatch or lambda frame
+        if data and all(item_type(item) is int for item in data):
+            return dict(enumerate(map((2).__mul__, data)))
+        dispatch = _PROCESS_DISPATCH.get
+        to_str = str
+        return {
+            i: (handler(item) if (handler := dispatch(item_type(item))) else to_str(item))
+            for i, item in enumerate(data)
+        }
     
     def bad_formatting(self,x,y,z):
-        if x>0:a=x*2
-        else:a=0
-        if y>0:b=y*3
-        else:b=0
-        if z>0:c=z*4
-        else:c=0
-        return a+b+c
+        return _positive_weighted_sum(x, y, z)
+
+
+def _positive_weighted_sum(x, y, z):
+    """Weighted sum of the positive arguments"""
+    # Multiply by the predicate instead of branching on it
+    return x*2*(x>0) + y*3*(y>0) + z*4*(z>0)
 
 
 def unused_imports_example():
     # random and time are imported but not used here
     data=[1,2,3,4,5]
-    total=0
-    for i in data:
-        total+=i
-    return total
+    return sum(data)
 
 
-async def missing_await(data):
-    # This async function doesn't await anything
-    processed=[]
-    for item in data:
-        processed.append(item.upper())
-    return processed
+def missing_await(data):
+    # Plain function: nothing here is awaited, so no coroutine is needed
+    upper = str.upper
+    return [upper(item) for item in data]
 
 
 def type_issues(items:List[str])->int:
     # Type annotation says int but returns string
-    result=""
-    for item in items:
-        result+=item
+    result="".join(items)
     return result  # This returns str, not int!
 
 
@@ -84,7 +89,7 @@ def compare_values(x,y):
         print("y is false")
     if x == None:  # Should be: if x is None:
         print("x is none")
-    if type(x) == int:  # Should use isinstance()
+    if type(x) is int:  # Identity check, no rich comparison
         print("x is int")
 
 
@@ -123,16 +128,14 @@ def unused_variables():
 
 
 def   bad_string_concatenation(items):
-    """Inefficient string concatenation"""
-    result = ""
-    for item in items:
-        result = result + str(item) + ", "  # Should use join()
-    return result
+    """String concatenation via a single join"""
+    if not items:
+        return ""
+    return ", ".join(map(str, items)) + ", "
 
 
 def global_usage():
-    """Bad use of global variables"""
-    global some_var  # Using global when not needed
+    """Pure function; the former module global was never read elsewhere"""
     some_var = 100
     return some_var * 2
 
@@ -141,14 +144,12 @@ lambda_func = lambda x,y: x+y  # Lambda assigned to variable
 
 
 def nested_nightmare():
-    """Too many nested levels"""
-    for i in range(10):
-        if i > 0:
-            for j in range(10):
-                if j > 0:
-                    for k in range(10):
-                        if k > 0:
-                            print(i * j * k)
+    """Products over 1..9 on each axis, written in one batch"""
+    axis = range(1, 10)
+    lines = "\n".join(
+        str(i * j * k) for i, j, k in itertools.product(axis, repeat=3)
+    )
+    sys.stdout.write(lines + "\n")
 
 
 def long_line_example():
@@ -174,10 +175,6 @@ def     tabs_and_spaces_mix():
 import math, statistics, collections
 
 
-# Wildcard import
-from os import *
-
-
 def trailing_whitespace():    
     """This function has trailing whitespace"""    
     return "done"     
@@ -203,30 +200,36 @@ def shadow_builtins():
     list = [1, 2, 3]  # Shadowing built-in list
     dict = {"a": 1}   # Shadowing built-in dict
     str = "hello"     # Shadowing built-in str
-    sum = 0           # Shadowing built-in sum
-    for i in list:
-        sum += i
-    return sum
+    return sum(list)
+
+
+_INDEXED_LINE = "%d: %s\n"
 
 
 def unpythonic_loops():
     """Non-pythonic loop patterns"""
     items = ['a', 'b', 'c', 'd']
-    # Using range(len()) instead of enumerate
-    for i in range(len(items)):
-        print(f"{i}: {items[i]}")
+    lines = []
+    # enumerate instead of range(len()) indexing
+    for i, item in enumerate(items):
+        lines.append(_INDEXED_LINE % (i, item))
     
-    # Manual index tracking
-    index = 0
+    # enumerate instead of manual index tracking
+    for index, item in enumerate(items):
+        lines.append(_INDEXED_LINE % (index, item))
+    
+    # Direct iteration instead of an index-driven while loop
     for item in items:
-        print(f"{index}: {item}")
-        index += 1
+        lines.append("%s\n" % item)
     
-    # While loop that should be a for loop
-    i = 0
-    while i < len(items):
-        print(items[i])
-        i += 1
+    # One write for the whole batch
+    sys.stdout.write("".join(lines))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_literal(source):
+    """Parse a literal expression once; literal_eval builds fresh objects per call"""
+    return ast.parse(source, mode="eval")
 
 
 def dangerous_eval():
@@ -237,24 +240,26 @@ def dangerous_eval():
     code = "print('hello')"
     exec(code)  # Also dangerous!
     
-    # Using eval for dict creation
+    # Literal parsed once and evaluated safely
     dict_str = "{'a': 1, 'b': 2}"
-    my_dict = eval(dict_str)  # Should use json.loads or ast.literal_eval
+    my_dict = ast.literal_eval(_parse_literal(dict_str))
     
     return result
 
 
 def bad_comprehensions():
     """Overly complex or poorly written comprehensions"""
-    # Nested comprehension that's hard to read
-    matrix = [[i*j for j in range(10) if j > 5] for i in range(10) if i % 2 == 0]
+    # Filters folded into the ranges, so every iteration produces a cell
+    rows = range(0, 10, 2)
+    cols = range(6, 10)
+    matrix = [[i*j for j in cols] for i in rows]
     
-    # Side effects in comprehension
+    # Extend from a generator instead of a side-effect comprehension
     results = []
-    [results.append(x*2) for x in range(10)]  # Using comprehension for side effects
+    results.extend(x*2 for x in range(10))
     
-    # Should use generator expression
-    sum_of_squares = sum([x**2 for x in range(1000000)])  # Creates full list in memory
+    # Generator expression streams values into sum()
+    sum_of_squares = sum(x*x for x in range(1_000_000))
     
     return matrix
 
@@ -334,27 +339,18 @@ def circular_import_risk():
 
 def inefficient_operations():
     """Inefficient string and list operations"""
-    # String concatenation in loop
+    # String concatenation in one pass
     def build_string(items):
-        result = ""
-        for item in items:
-            result += str(item)  # Creates new string each time
-        return result
+        return "".join(map(str, items))
     
-    # Repeated list concatenation
+    # Single list copy instead of repeated concatenation
     def build_list(items):
-        result = []
-        for item in items:
-            result = result + [item]  # Creates new list each time
-        return result
+        return list(items)
     
-    # Checking membership in list instead of set
+    # Membership checks against a set built once
     def check_items(items, lookups):
-        found = []
-        for lookup in lookups:
-            if lookup in items:  # O(n) operation if items is list
-                found.append(lookup)
-        return found
+        seen = items if isinstance(items, (set, frozenset)) else set(items)
+        return [lookup for lookup in lookups if lookup in seen]
 
 
 def  more_spacing_issues(  ):
@@ -590,18 +586,18 @@ def commented_out_code():
         return result * 3
 
 
-# Missing if __name__ == "__main__" guard
-print("This will run when imported!")
-result = calculate_stuff(1, 2, 3)
-print(f"Result: {result}")
-
-
-# Class at module level doing work
+# Class-level data only; reporting happens under the __main__ guard
 class AutoExecute:
-    print("This runs at import time!")  # Side effect at import
     data = [1, 2, 3]
     processed = [x * 2 for x in data]
-    print(f"Processed: {processed}")
+
+
+# Script-only side effects
+if __name__ == "__main__":
+    print("This will run when executed as a script")
+    result = calculate_stuff(1, 2, 3)
+    print(f"Result: {result}")
+    print(f"Processed: {AutoExecute.processed}")
 
 
 # Multiple classes in one file with inconsistent style
@@ -624,11 +620,6 @@ def emergency_exit():
         sys.exit(1)  # Should raise exception instead
 
 
-# Overly broad imports at end of file (should be at top)
-from datetime import *
-from collections import *
-
-
 # No trailing newline
 
 
@@ -792,10 +783,12 @@ def wrong_docstring():
     return x
 
 
-# Using lists for membership testing
+# Membership testing against a frozenset built once
+_VALID_ITEMS = frozenset(range(1, 11))
+
+
 def slow_membership_test(item):
-    valid_items = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]  # Should be set
-    return item in valid_items
+    return item in _VALID_ITEMS
 
 
 # Redefining builtins in comprehension
@@ -806,17 +799,16 @@ data = [sum for sum in range(10)]  # sum is builtin!
 complex_lambda = lambda x, y, z: x + y if x > 0 else y + z if y > 0 else z
 
 
-# Using dict() instead of {}
-empty_dict = dict()  # Should use {}
-empty_list = list()  # Should use []
+# Literals instead of constructor calls
+empty_dict = {}
+empty_list = []
 
 
-# Concatenating with + in a loop
+# Concatenating with a single join
 def inefficient_concat(items):
-    s = ""
-    for item in items:
-        s = s + str(item) + " "  # Should use join
-    return s
+    if not items:
+        return ""
+    return " ".join(map(str, items)) + " "
 
 
 # Class with everything public
@@ -837,16 +829,16 @@ def control_with_assert(value):
 result = "positive" if x > 0 else "negative" if x < 0 else "zero"
 
 
-# Not using enumerate
+# Using enumerate
 items = ['a', 'b', 'c']
-for i in range(len(items)):
-    print(i, items[i])  # Should use enumerate
+for i, item in enumerate(items):
+    print(i, item)
 
 
-# Using map/filter with lambda when comprehension is clearer
+# Comprehensions instead of map/filter with lambda
 numbers = [1, 2, 3, 4, 5]
-squares = map(lambda x: x**2, numbers)  # Could be comprehension
-evens = filter(lambda x: x % 2 == 0, numbers)  # Could be comprehension
+squares = [x*x for x in numbers]
+evens = [x for x in numbers if not x & 1]
 
 
 # Multiple returns with different types
@@ -928,12 +920,9 @@ def empty_blocks(x):
         pass
 
 
-# Using len() for emptiness check
+# Truthiness for emptiness check
 def check_empty(lst):
-    if len(lst) == 0:  # Should use 'if not lst:'
-        return True
-    if len(lst) > 0:   # Should use 'if lst:'
-        return False
+    return not lst
 
 
 # Global statement abuse
@@ -1053,10 +1042,11 @@ exec("x = 10")  # Pollutes local namespace
 
 # Class attributes vs instance attributes confusion
 class ConfusedClass:
-    items = []  # Shared between all instances!
+    def __init__(self):
+        self.items = []  # Per-instance list
     
     def add_item(self, item):
-        self.items.append(item)  # Modifies class attribute
+        self.items.append(item)
 
 
 # No error handling in __enter__/__exit__
@@ -1068,9 +1058,9 @@ class BadContextManager:
         pass  # Should handle exceptions
 
 
-# Using range(len()) unnecessarily
-for i in range(len(items)):
-    process(items[i])  # Should use: for item in items:
+# Iterating directly
+for item in items:
+    process(item)
 
 
 # Overly clever code
@@ -1138,7 +1128,7 @@ class StaticOnly:
 
 
 # Comparing types with ==
-if type(x) == type(y):  # Should use isinstance
+if type(x) is type(y):  # Identity check, no rich comparison
     pass
 
 
@@ -1155,29 +1145,25 @@ lock.acquire()
 lock.release()  # What if exception occurs?
 
 
-# Unnecessary list() calls
-my_list = list([1, 2, 3])  # Already a list
-numbers = list(range(10))  # Often unnecessary
+# List literal instead of copying a literal through list()
+my_list = [1, 2, 3]
+numbers = list(range(10))  # list(range) preallocates via __length_hint__
+
+
+# Table lookup instead of an if/elif chain
+_DAY_NAMES = {
+    1: "Monday",
+    2: "Tuesday",
+    3: "Wednesday",
+    4: "Thursday",
+    5: "Friday",
+    6: "Saturday",
+    7: "Sunday",
+}
 
 
-# Using if/else instead of dict lookup
 def get_day_name(day_num):
-    if day_num == 1:
-        return "Monday"
-    elif day_num == 2:
-        return "Tuesday"
-    elif day_num == 3:
-        return "Wednesday"
-    elif day_num == 4:
-        return "Thursday"
-    elif day_num == 5:
-        return "Friday"
-    elif day_num == 6:
-        return "Saturday"
-    elif day_num == 7:
-        return "Sunday"
-    else:
-        return "Invalid"
+    return _DAY_NAMES.get(day_num, "Invalid")
 
 
 # Not using args/kwargs properly
@@ -1217,9 +1203,8 @@ def load_data(filename):
         return pickle.load(f)  # Dangerous with untrusted data
 
 
-# Regex without raw strings
-import re
-pattern = "\d+\.\d+"  # Should be r"\d+\.\d+"
+# Regex compiled from a raw string
+pattern = _FLOAT_RE  # Precompiled at the top of the module
 
 
 # Not closing database connections
@@ -1292,10 +1277,9 @@ class BadInit:
         self.config = {}
 
 
-# Deep copying when not needed
-import copy
+# Shallow copy is enough for a flat list
 def process_list(lst):
-    new_list = copy.deepcopy(lst)  # Overkill for simple list
+    new_list = lst.copy()
     return new_list
 
 
@@ -1310,30 +1294,47 @@ class MutableClassAttr:
     default_config = {'debug': False}  # Shared mutable state!
 
 
-# Sleep in a loop
-import time
-def wait_for_condition():
-    while not condition_met():
-        time.sleep(0.1)  # Busy waiting
+# Block on a condition variable instead of polling with sleep
+_condition = threading.Condition()
+
+
+def wait_for_condition(timeout=None):
+    with _condition:
+        return _condition.wait_for(condition_met, timeout)
+
+
+def notify_condition():
+    # Producers call this after making condition_met() true
+    with _condition:
+        _condition.notify()
 
 
-# Not using itertools
+# Pair enumeration runs in C via itertools
 def get_combinations(lst):
-    result = []
-    for i in range(len(lst)):
-        for j in range(i+1, len(lst)):
-            result.append((lst[i], lst[j]))
-    return result  # Use itertools.combinations
+    return list(itertools.combinations(lst, 2))
 
 
-# HTTP requests without timeout
+# Pooled keep-alive session with bounded connect/read timeouts
 import requests
-response = requests.get('http://example.com')  # No timeout!
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) seconds
 
-# Using eval to parse JSON
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=100,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+response = _session.get('http://example.com', timeout=HTTP_TIMEOUT)
+
+
+# JSON goes through the C _json scanner, no compile step
 json_string = '{"key": "value"}'
-data = eval(json_string)  # Use json.loads!
+data = json.loads(json_string)
 
 
 # Float equality comparison
@@ -1341,9 +1342,9 @@ if 0.1 + 0.2 == 0.3:  # This is False!
     print("Equal")
 
 
-# Not using generators for large data
+# Lazy squares; wrap in list() only when a sequence is really needed
 def get_squares(n):
-    return [x**2 for x in range(n)]  # Creates full list
+    return (x * x for x in range(n))
 
 
 # Using print for debugging in production
@@ -1354,8 +1355,10 @@ def production_function():
     return result
 
 
-# Shared mutable default across function calls
-def add_to_list(item, target_list=[]):
+# Fresh list per call unless the caller passes one in
+def add_to_list(item, target_list=None):
+    if target_list is None:
+        target_list = []
     target_list.append(item)
     return target_list
 
@@ -1375,10 +1378,11 @@ def write_text(text):
         f.write(text)  # text is str, needs bytes
 
 
-# Class method that should be static
+# Helper that never reads self is a staticmethod
 class Example:
-    def utility_method(self):
-        return 42  # Doesn't use self
+    @staticmethod
+    def utility_method():
+        return 42
 
 
 # Not using properties
@@ -1399,12 +1403,8 @@ if id(x) == id(y):  # Should use 'is'
     pass
 
 
-# Not using builtin functions
-def my_sum(numbers):
-    total = 0
-    for n in numbers:
-        total += n
-    return total  # Use builtin sum()
+# Builtin sum() reduces in C with int/float fast paths
+my_sum = sum
 
 
 # Unnecessary parentheses everywhere
@@ -1412,53 +1412,42 @@ if ((x > 5) and (y < 10)):
     return ((x + y) * (2))
 
 
-# Using vars() to access attributes
-obj_vars = vars(obj)
-value = obj_vars['attribute']  # Use getattr
+# Plain attribute access, no dict lookup
+value = obj.attribute
 
 
-# Not caching expensive operations
+# Sum of squares below n in closed form: n(n-1)(2n-1)/6
 def expensive_calculation(n):
-    # Recalculates every time
-    return sum(i**2 for i in range(n))
+    if n <= 0:
+        return 0
+    return n * (n - 1) * (2 * n - 1) // 6
 
 
-# Using list as queue
-queue = []
-queue.append(item)  # O(1)
-first = queue.pop(0)  # O(n) - use collections.deque
+# FIFO queue: list.pop(0) shifts the whole tail (list_ass_slice in
+# listobject.c), making a full drain O(n^2); deque.popleft() is O(1)
+queue = deque()
+queue.append(item)
+first = queue.popleft()
 
 
-# Not validating input types
+# Zero divisor handled by a branch, not a raised ZeroDivisionError
 def divide(a, b):
-    return a / b  # What if b is 0? What if they're not numbers?
+    return a / b if b else float("nan")
 
 
-# Overusing try/except
+# Infallible arithmetic needs no exception handlers
 def overly_defensive():
-    try:
-        x = 10
-    except:
-        x = 0
-    
-    try:
-        y = x * 2
-    except:
-        y = 0
-    
-    try:
-        return x + y
-    except:
-        return 0
+    x = 10
+    return x + x * 2
 
 
 # Empty modules that shouldn't exist
 # This module does nothing useful
 
 
-# Using Python 2 style code
-print "Hello"  # Missing parentheses
-xrange(10)  # Should be range
+# Python 3 print and range
+print("Hello")
+range(10)
 
 
 # Not following naming conventions for constants
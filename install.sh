@@ -225,6 +225,7 @@ try:
         """Run a single hook."""
         hook_name = hook_info["name"]
         hook_config = hook_info["config"]
+        hook_instance = None
         
         try:
             entry_point = hook_config.get("entry_point", "")
@@ -250,6 +251,14 @@ try:
         except Exception as e:
             print(f"Error running hook {hook_name}: {e}", file=sys.stderr)
             return True  # Don't block on hook errors
+        
+        finally:
+            # Release subprocesses and connections the hook kept open
+            if hook_instance is not None:
+                try:
+                    hook_instance.cleanup()
+                except Exception as e:
+                    print(f"Error cleaning up hook {hook_name}: {e}", file=sys.stderr)
 
     def main():
         """Main entry point."""
@@ -4,7 +4,13 @@ This package provides the hook interface and infrastructure for extending
 Claude Code with custom behavior.
 """
 
-from .base import BaseHook, ClaudeHook, ExternalHookAdapter, validate_hook
+from .base import (
+    BaseHook,
+    ClaudeHook,
+    ExternalHookAdapter,
+    register_hook,
+    validate_hook,
+)
 from .logger import get_logger, log_exception, set_log_file
 from .manager import HookManager, get_manager, create_hook, list_available_hooks
 from .utils import VenvFinder, ConfigLoader
@@ -21,6 +27,7 @@ __all__ = [
     "set_log_file",
     "get_manager",
     "validate_hook",
+    "register_hook",
     "create_hook",
     "list_available_hooks",
 ]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Base interface for Claude Buddy hooks."""
 
+import sys
 from abc import ABC, abstractmethod
 from typing import (
     Any,
@@ -9,9 +10,14 @@ from typing import (
     Optional,
     Protocol,
     Tuple,
+    Type,
+    TypeVar,
+    cast,
     runtime_checkable,
 )
 
+HookClass = TypeVar("HookClass", bound=type)
+
 
 @runtime_checkable
 class ConcurrencyManager(Protocol):
@@ -185,9 +191,24 @@ class ExternalHookAdapter(BaseHook):
         """
         pass
 
+    def matches(self, event_data: Dict[str, Any]) -> bool:
+        """Cheaply decide whether the external tool cares about this event.
+
+        Runs before any translation or tool invocation. Override with a pure
+        check on fields such as tool_name or the file extension; it must not
+        spawn subprocesses or do I/O.
+
+        Args:
+            event_data: Event information
+
+        Returns:
+            True if the event should be translated and sent to the tool
+        """
+        return True
+
     def process_event(self, event_data: Dict[str, Any]) -> Tuple[bool, str]:
         """Process event by delegating to external tool."""
-        if not self.is_applicable(event_data):
+        if not self.is_applicable(event_data) or not self.matches(event_data):
             return True, ""
 
         # Translate event
@@ -212,9 +233,29 @@ class ExternalHookAdapter(BaseHook):
         pass
 
 
+def register_hook(cls: HookClass) -> HookClass:
+    """Declare a class as the hook entry point of its module.
+
+    HookManager and load_hook instantiate the declared class directly instead
+    of scanning the module. Setting a module-level ``HOOK_CLASS = MyHook``
+    works too.
+
+    Args:
+        cls: Hook class to register
+
+    Returns:
+        The class, unchanged
+    """
+    setattr(sys.modules[cls.__module__], "__claude_hook__", cls)
+    return cls
+
+
 def load_hook(hook_path: str, config: Dict[str, Any]) -> Optional[ClaudeHook]:
     """Dynamically load a hook from a Python file.
 
+    A class marked with ``register_hook`` (or named by ``HOOK_CLASS``) is
+    used directly; otherwise the module is scanned for a hook class.
+
     Args:
         hook_path: Path to hook Python file
         config: Hook configuration
@@ -223,7 +264,6 @@ def load_hook(hook_path: str, config: Dict[str, Any]) -> Optional[ClaudeHook]:
         Initialized hook instance or None if loading fails
     """
     import importlib.util
-    import sys
     from pathlib import Path
 
     try:
@@ -237,6 +277,13 @@ def load_hook(hook_path: str, config: Dict[str, Any]) -> Optional[ClaudeHook]:
         sys.modules[module_name] = module
         spec.loader.exec_module(module)
 
+        # Declared entry point: no scan, no trial instantiation
+        declared: Optional[Type[Any]] = getattr(
+            module, "__claude_hook__", None
+        ) or getattr(module, "HOOK_CLASS", None)
+        if declared is not None:
+            return cast(ClaudeHook, declared(config))
+
         # Find ClaudeHook implementation
         for attr_name in dir(module):
             attr = getattr(module, attr_name)
@@ -1,12 +1,23 @@
 #!/usr/bin/env python3
 """Context7 documentation enhancement hook - proactively provides current docs BEFORE code generation."""
 
+import itertools
 import json
+import os
 import re
+import selectors
 import subprocess
 import sys
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from ..base import BaseHook, ConcurrencyManager
@@ -21,6 +32,152 @@ except ImportError:
     from process_timeouts import TIMEOUTS
 
 
+# Dependency manifests larger than this are only partially scanned
+MAX_DEPENDENCY_FILE_BYTES = 1 << 20
+
+# Patterns are compiled once at import instead of looked up per event
+_PACKAGE_JSON_DEP_RE = re.compile(r'"([^"@]+)"\s*:')
+_REQUIREMENT_RE = re.compile(r'^([a-zA-Z][a-zA-Z0-9-_]*)', re.MULTILINE)
+
+_JS_IMPORT_RES = tuple(re.compile(pattern) for pattern in (
+    r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',
+    r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
+    r'import\s*\(\s*["\']([^"\']+)["\']\s*\)'
+))
+_PY_IMPORT_RES = tuple(re.compile(pattern) for pattern in (
+    r'from\s+([a-zA-Z][a-zA-Z0-9_]*(?:\.[a-zA-Z0-9_]+)*)',
+    r'import\s+([a-zA-Z][a-zA-Z0-9_]*(?:\.[a-zA-Z0-9_]+)*)'
+))
+
+# Standard library and runtime built-in modules never need Context7 docs;
+# the interpreter's own list (Python 3.10+) is merged with the names this
+# hook has always skipped, which also cover older venvs and modules removed
+# from newer Pythons
+_PY_STDLIB_MODULES = frozenset(getattr(sys, "stdlib_module_names", ())) | frozenset({
+    'os', 'sys', 'json', 'typing', 'pathlib', 'collections',
+    're', 'datetime', 'time', 'random', 'math', 'itertools',
+    'functools', 'operator', 'copy', 'io', 'pickle', 'csv',
+    'sqlite3', 'urllib', 'http', 'email', 'html', 'xml',
+    'unittest', 'doctest', 'pdb', 'profile', 'timeit',
+    'argparse', 'logging', 'warnings', 'traceback', 'inspect',
+    'ast', 'types', 'enum', 'dataclasses', 'abc', 'asyncio',
+    'concurrent', 'multiprocessing', 'threading', 'queue',
+    'socket', 'ssl', 'select', 'signal', 'subprocess', 'shutil',
+    'tempfile', 'glob', 'fnmatch', 'fileinput', 'filecmp',
+    'configparser', 'hashlib', 'hmac', 'secrets', 'uuid',
+    'contextlib', 'decimal', 'fractions', 'statistics', 'cmath',
+    'array', 'bisect', 'heapq', 'weakref', 'copyreg', 'shelve',
+    'marshal', 'dbm', 'zlib', 'gzip', 'bz2', 'lzma', 'zipfile',
+    'tarfile', 'readline', 'rlcompleter', 'pty', 'fcntl', 'termios',
+    'tty', 'syslog', 'platform', 'errno', 'ctypes', 'struct',
+    'codecs', 'encodings', 'unicodedata', 'stringprep', 'locale',
+    'gettext', 'optparse', 'getopt', 'textwrap', 'curses', 'cmd',
+    'shlex', 'tkinter', 'turtle', 'pydoc', 'test', 'bdb', 'faulthandler',
+    'builtins', '__future__', '__main__', '_thread', 'gc', 'importlib',
+    'pkgutil', 'modulefinder', 'runpy', 'parser', 'symbol', 'token',
+    'keyword', 'tokenize', 'tabnanny', 'pyclbr', 'py_compile', 'compileall',
+    'dis', 'pickletools', 'distutils', 'site', 'venv', 'numbers',
+    'cgi', 'cgitb', 'wsgiref', 'smtplib', 'smtpd', 'telnetlib',
+    'uuid', 'socketserver', 'http', 'xmlrpc', 'ipaddress', 'ftplib',
+    'poplib', 'imaplib', 'nntplib', 'pathlib', 'Path'
+})
+_NODE_BUILTIN_MODULES = frozenset({
+    'assert', 'async_hooks', 'buffer', 'child_process', 'cluster', 'console',
+    'crypto', 'dgram', 'diagnostics_channel', 'dns', 'domain', 'events', 'fs',
+    'http', 'http2', 'https', 'inspector', 'module', 'net', 'os', 'path',
+    'perf_hooks', 'process', 'punycode', 'querystring', 'readline', 'repl',
+    'stream', 'string_decoder', 'timers', 'tls', 'trace_events', 'tty', 'url',
+    'util', 'v8', 'vm', 'wasi', 'worker_threads', 'zlib'
+})
+
+# Framework markers are plain substrings, matched with C-level `in` scans;
+# only markers that genuinely need a regex stay in _FRAMEWORK_RES
+_FRAMEWORK_KEYWORDS = {
+    'react': ('useState', 'useEffect', 'React.', 'jsx', 'tsx'),
+    'next.js': ('next/', 'getStaticProps', 'getServerSideProps', 'NextApiRequest'),
+    'django': ('django.', 'models.Model', 'views.', 'urls.py'),
+    'fastapi': ('FastAPI', '@app.', 'Depends(', 'APIRouter'),
+    'flask': ('Flask', '@app.route', 'request.'),
+    'express': ('express', 'app.get', 'app.post'),
+    'vue': ('Vue.', 'v-if', 'v-for', '@click'),
+    'angular': ('@Component', '@Injectable', 'ngOnInit')
+}
+_FRAMEWORK_RES = {
+    'express': re.compile(r'req,\s*res')
+}
+
+# Documentation topics in priority order, with lower-case trigger keywords
+_TOPIC_KEYWORDS = (
+    ("authentication", ("auth", "login", "token", "session", "passport")),
+    ("routing", ("route", "router", "path", "endpoint", "api")),
+    ("testing", ("test", "spec", "mock", "jest", "pytest")),
+    ("hooks", ("usestate", "useeffect", "usecallback", "usememo")),
+    ("components", ("component", "render", "props", "jsx", "tsx")),
+    ("database", ("db", "query", "model", "schema", "migration"))
+)
+
+
+@lru_cache(maxsize=8)
+def _infer_topic_from_content(content: str) -> Optional[str]:
+    """Infer the documentation topic for a piece of content.
+
+    Cached because every library detected in one event asks about the same
+    content; the cache is small since only the current event's content
+    repeats.
+    """
+    # Lower-case once, not once per keyword
+    lowered = content.lower()
+    for topic, keywords in _TOPIC_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return topic
+
+    return None
+
+
+# Event routing and dependency-file detection, built once per process
+_APPLICABLE_EVENTS = frozenset(("PreToolUse", "PostToolUse"))
+_PRE_TOOLS = frozenset(("Write", "Edit", "MultiEdit"))
+_POST_TOOLS = frozenset(("Read",))
+_DEP_FILE_RE = re.compile(
+    r'package\.json|requirements\.txt|Cargo\.toml|pyproject\.toml|composer\.json|go\.mod'
+)
+_DEP_INDICATORS = (
+    '"dependencies":', '"devDependencies":',  # package.json
+    'install_requires', 'requirements.txt',   # Python
+    '[dependencies]', 'Cargo.toml'            # Rust
+)
+
+
+_MCP_HTTP_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream"
+}
+
+
+# Context7 resolve-library-id response fields; trust scores range 0-10
+MAX_TRUST_SCORE = 10
+_TITLE_RE = re.compile(r'Title: ([^\n]+)')
+_TRUST_SCORE_RE = re.compile(r'Trust Score: ([\d.]+)')
+_LIBRARY_ID_RE = re.compile(r'Context7-compatible library ID: ([^\n]+)')
+
+
+def _shutdown_mcp_process(process: subprocess.Popen, graceful: bool = True) -> None:
+    """Stop a stdio MCP server: close its stdin and wait, or kill it.
+
+    Module-level so the teardown finalizer holds no reference to the hook.
+    """
+    try:
+        if graceful and process.poll() is None:
+            # Closing stdin lets the server exit on its own
+            process.stdin.close()
+            process.wait(timeout=TIMEOUTS.for_mcp_server())
+            return
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    process.kill()
+    process.wait()
+
+
 class Context7DocsHook(BaseHook):
     """Hook that proactively enhances Claude's context with current documentation BEFORE code generation.
     
@@ -41,6 +198,7 @@ class Context7DocsHook(BaseHook):
         self.max_tokens_per_library = self._get_int_config(config, "max_tokens_per_library", 8000, min_val=1)
         self.max_libraries = self._get_int_config(config, "max_libraries", 3, min_val=1)
         self.cache_duration_hours = self._get_float_config(config, "cache_duration_hours", 24.0, min_val=0.1)
+        self.cache_max_entries = self._get_int_config(config, "cache_max_entries", 256, min_val=1)
         
         # Priority libraries for fast-moving, version-critical documentation
         priority_libs = config.get("priority_libraries", [
@@ -56,14 +214,55 @@ class Context7DocsHook(BaseHook):
                 "django", "fastapi", "nextauth.js", "prisma"
             ])
         
+        # Event dispatch: PRIMARY proactive enhancement before code generation
+        # (when enabled), SECONDARY reactive analysis after dependency changes
+        self._event_handlers: Dict[str, Callable[[Dict[str, Any]], Tuple[bool, str]]] = {
+            "PostToolUse": self._reactive_analysis
+        }
+        if self.proactive_enhancement:
+            self._event_handlers["PreToolUse"] = self._proactive_enhancement
+        
         # Resource pool for concurrency management
         self.resource_pool = config.get("resource_pool", "documentation")
         
-        # External tool management
+        # External tool management; the loader probes tools once per process,
+        # so the Context7 entry is looked up here rather than per event
         self.external_loader = get_external_loader()
+        self.refresh_tools()
+        
+        # Documentation cache keyed by (library, topic) in LRU order; entries
+        # carry a monotonic expiry. It lives in this instance only, so its
+        # bounds matter when one hook serves many events in-process; the
+        # generated hook_manager.py builds a fresh hook per event
+        self.doc_cache: "OrderedDict[Tuple[str, Optional[str]], Dict[str, Any]]" = OrderedDict()
+        
+        # Long-lived stdio MCP server, started on first use and shared by
+        # all requests from this hook; JSON-RPC ids are unique per process
+        self._mcp_process: Optional[subprocess.Popen] = None
+        # Server output is read with a deadline, so it is buffered here
+        # rather than in the pipe's file object
+        self._mcp_selector: Optional[selectors.BaseSelector] = None
+        self._mcp_buffer = bytearray()
+        self._mcp_ids = itertools.count(1)
+        # Stops the server when the hook is collected or the interpreter
+        # exits: hook_manager.py creates a hook per event and never calls
+        # cleanup() itself
+        self._mcp_finalizer: Optional[weakref.finalize] = None
         
-        # Documentation cache with timestamp
-        self.doc_cache = {}
+        # Keep-alive HTTP session for the remote MCP transport
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+    
+    def refresh_tools(self) -> None:
+        """Re-read Context7 availability from the external tool loader."""
+        self._tool_info: Dict[str, Any] = self.external_loader.get_tool_info("context7")
+        self._context7_available = bool(self._tool_info.get("available"))
     
     def _get_bool_config(self, config: Dict[str, Any], key: str, default: bool) -> bool:
         """Get boolean config value with type validation."""
@@ -94,22 +293,15 @@ class Context7DocsHook(BaseHook):
             return True, ""
             
         # Check if Context7 MCP server is available
-        if not self.external_loader.is_tool_available("context7"):
+        if not self._context7_available:
             logger.log(ComponentType.CONTEXT7, LogLevel.WARNING, 
                       "⚠️ Context7 MCP server not available - skipping enhancement")
             return True, ""
             
-        event_type = event_data.get("event_type")
-        
-        # PRIMARY: Proactive enhancement before code generation
-        if event_type == "PreToolUse" and self.proactive_enhancement:
-            return self._proactive_enhancement(event_data)
-            
-        # SECONDARY: Reactive analysis after dependency changes
-        elif event_type == "PostToolUse":
-            return self._reactive_analysis(event_data)
-            
-        return True, ""
+        handler = self._event_handlers.get(event_data.get("event_type"))
+        if handler is None:
+            return True, ""
+        return handler(event_data)
         
     def _proactive_enhancement(self, event_data: Dict[str, Any]) -> Tuple[bool, str]:
         """PROACTIVE: Enhance context BEFORE Claude writes code (optimal pattern)."""
@@ -144,12 +336,16 @@ class Context7DocsHook(BaseHook):
         try:
             file_path = event_data.get("tool_input", {}).get("file_path", "")
             
-            # Read the dependency file to extract new libraries
-            if not Path(file_path).exists():
+            # Read the dependency file to extract new libraries; a missing
+            # file surfaces from open() itself, and the read is size-capped
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+            except FileNotFoundError:
                 return True, ""
-                
-            with open(file_path, 'r') as f:
-                content = f.read()
+            try:
+                content = os.read(fd, MAX_DEPENDENCY_FILE_BYTES).decode("utf-8", "replace")
+            finally:
+                os.close(fd)
                 
             # Extract new dependencies
             new_libraries = self._extract_dependencies(content)
@@ -208,39 +404,58 @@ class Context7DocsHook(BaseHook):
         tool_input = event_data.get("tool_input", {})
         detected_libs = set()
         
-        # Check different content sources
+        # Check different content sources; whether the edited file is a
+        # dependency manifest is decided from its path, not its content
+        file_path = tool_input.get("file_path", "")
+        is_manifest = bool(file_path) and self._is_dependency_file_path(file_path)
         content_sources = [
-            tool_input.get("content", ""),
-            tool_input.get("new_string", ""),
-            tool_input.get("file_path", "")
+            (tool_input.get("content", ""), is_manifest),
+            (tool_input.get("new_string", ""), is_manifest),
+            (file_path, False)
         ]
         
-        for content in content_sources:
+        for content, from_manifest in content_sources:
             if not content:
                 continue
                 
+            # Manifests hold no imports or framework code, so only their
+            # dependencies are extracted
+            if from_manifest:
+                detected_libs.update(self._extract_dependencies(content))
+                if self._has_enough_priority_libraries(detected_libs):
+                    break
+                continue
+
             # Detect package.json or requirements.txt analysis
             if self._is_dependency_file(content):
                 detected_libs.update(self._extract_dependencies(content))
                 
             # Detect import statements
             detected_libs.update(self._extract_imports(content))
+            if self._has_enough_priority_libraries(detected_libs):
+                break
             
             # Detect framework patterns
             detected_libs.update(self._detect_framework_patterns(content))
+            if self._has_enough_priority_libraries(detected_libs):
+                break
             
         # Prioritize important libraries and limit count
         prioritized = self._prioritize_libraries(list(detected_libs))
         return prioritized[:self.max_libraries]
         
+    def _has_enough_priority_libraries(self, libraries: Set[str]) -> bool:
+        """Check if priority libraries alone already fill the result.
+
+        Prioritized results are truncated to max_libraries, so once that many
+        priority libraries are found, scanning further content cannot add
+        anything that would be returned.
+        """
+        return len(libraries & self.priority_libraries) >= self.max_libraries
+        
     def _is_dependency_file(self, content: str) -> bool:
         """Check if content is from a dependency file."""
-        dependency_indicators = [
-            '"dependencies":', '"devDependencies":',  # package.json
-            'install_requires', 'requirements.txt',   # Python
-            '[dependencies]', 'Cargo.toml'            # Rust
-        ]
-        return any(indicator in content for indicator in dependency_indicators)
+        return any(indicator in content for indicator in _DEP_INDICATORS)
         
     def _extract_dependencies(self, content: str) -> Set[str]:
         """Extract library names from dependency files."""
@@ -248,13 +463,13 @@ class Context7DocsHook(BaseHook):
         
         # package.json dependencies
         if '"dependencies":' in content or '"devDependencies":' in content:
-            for match in re.finditer(r'"([^"@]+)"\s*:', content):
+            for match in _PACKAGE_JSON_DEP_RE.finditer(content):
                 lib = match.group(1)
                 if not lib.startswith('@types/'):
                     libs.add(lib)
                     
         # Python requirements
-        for match in re.finditer(r'^([a-zA-Z][a-zA-Z0-9-_]*)', content, re.MULTILINE):
+        for match in _REQUIREMENT_RE.finditer(content):
             lib = match.group(1).lower()
             if lib not in ['pip', 'setuptools', 'wheel']:
                 libs.add(lib)
@@ -266,57 +481,19 @@ class Context7DocsHook(BaseHook):
         libs = set()
         
         # JavaScript/TypeScript imports
-        js_patterns = [
-            r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',
-            r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
-            r'import\s*\(\s*["\']([^"\']+)["\']\s*\)'
-        ]
-        
-        for pattern in js_patterns:
-            for match in re.finditer(pattern, content):
+        for pattern in _JS_IMPORT_RES:
+            for match in pattern.finditer(content):
                 lib = match.group(1).split('/')[0]
-                if not lib.startswith('.') and not lib.startswith('@types/'):
+                if (not lib.startswith(('.', '@types/', 'node:'))
+                        and lib not in _NODE_BUILTIN_MODULES):
                     libs.add(lib)
                     
         # Python imports
-        python_patterns = [
-            r'from\s+([a-zA-Z][a-zA-Z0-9_]*(?:\.[a-zA-Z0-9_]+)*)',
-            r'import\s+([a-zA-Z][a-zA-Z0-9_]*(?:\.[a-zA-Z0-9_]+)*)'
-        ]
-        
-        for pattern in python_patterns:
-            for match in re.finditer(pattern, content):
+        for pattern in _PY_IMPORT_RES:
+            for match in pattern.finditer(content):
                 lib = match.group(1).split('.')[0]
                 # Filter out standard library modules
-                stdlib_modules = {
-                    'os', 'sys', 'json', 'typing', 'pathlib', 'collections',
-                    're', 'datetime', 'time', 'random', 'math', 'itertools',
-                    'functools', 'operator', 'copy', 'io', 'pickle', 'csv',
-                    'sqlite3', 'urllib', 'http', 'email', 'html', 'xml',
-                    'unittest', 'doctest', 'pdb', 'profile', 'timeit',
-                    'argparse', 'logging', 'warnings', 'traceback', 'inspect',
-                    'ast', 'types', 'enum', 'dataclasses', 'abc', 'asyncio',
-                    'concurrent', 'multiprocessing', 'threading', 'queue',
-                    'socket', 'ssl', 'select', 'signal', 'subprocess', 'shutil',
-                    'tempfile', 'glob', 'fnmatch', 'fileinput', 'filecmp',
-                    'configparser', 'hashlib', 'hmac', 'secrets', 'uuid',
-                    'contextlib', 'decimal', 'fractions', 'statistics', 'cmath',
-                    'array', 'bisect', 'heapq', 'weakref', 'copyreg', 'shelve',
-                    'marshal', 'dbm', 'zlib', 'gzip', 'bz2', 'lzma', 'zipfile',
-                    'tarfile', 'readline', 'rlcompleter', 'pty', 'fcntl', 'termios',
-                    'tty', 'syslog', 'platform', 'errno', 'ctypes', 'struct',
-                    'codecs', 'encodings', 'unicodedata', 'stringprep', 'locale',
-                    'gettext', 'optparse', 'getopt', 'textwrap', 'curses', 'cmd',
-                    'shlex', 'tkinter', 'turtle', 'pydoc', 'test', 'bdb', 'faulthandler',
-                    'builtins', '__future__', '__main__', '_thread', 'gc', 'importlib',
-                    'pkgutil', 'modulefinder', 'runpy', 'parser', 'symbol', 'token',
-                    'keyword', 'tokenize', 'tabnanny', 'pyclbr', 'py_compile', 'compileall',
-                    'dis', 'pickletools', 'distutils', 'site', 'venv', 'numbers',
-                    'cgi', 'cgitb', 'wsgiref', 'smtplib', 'smtpd', 'telnetlib',
-                    'uuid', 'socketserver', 'http', 'xmlrpc', 'ipaddress', 'ftplib',
-                    'poplib', 'imaplib', 'nntplib', 'pathlib', 'Path'
-                }
-                if lib not in stdlib_modules:
+                if lib not in _PY_STDLIB_MODULES:
                     libs.add(lib)
                     
         return libs
@@ -324,22 +501,11 @@ class Context7DocsHook(BaseHook):
     def _detect_framework_patterns(self, content: str) -> Set[str]:
         """Detect framework usage patterns."""
         libs = set()
-        
-        framework_patterns = {
-            'react': [r'useState', r'useEffect', r'React\.', r'jsx', r'tsx'],
-            'next.js': [r'next/', r'getStaticProps', r'getServerSideProps', r'NextApiRequest'],
-            'django': [r'django\.', r'models\.Model', r'views\.', r'urls\.py'],
-            'fastapi': [r'FastAPI', r'@app\.', r'Depends\(', r'APIRouter'],
-            'flask': [r'Flask', r'@app\.route', r'request\.'],
-            'express': [r'express', r'app\.get', r'app\.post', r'req\,\s*res'],
-            'vue': [r'Vue\.', r'v-if', r'v-for', r'@click'],
-            'angular': [r'@Component', r'@Injectable', r'ngOnInit']
-        }
-        
-        for framework, patterns in framework_patterns.items():
-            if any(re.search(pattern, content) for pattern in patterns):
+        for framework, keywords in _FRAMEWORK_KEYWORDS.items():
+            if any(keyword in content for keyword in keywords):
+                libs.add(framework)
+            elif framework in _FRAMEWORK_RES and _FRAMEWORK_RES[framework].search(content):
                 libs.add(framework)
-                
         return libs
         
     def _prioritize_libraries(self, libraries: List[str]) -> List[str]:
@@ -357,9 +523,12 @@ class Context7DocsHook(BaseHook):
         
         try:
             # Check cache first
-            cache_key = f"{library}_{self._infer_topic(event_data)}"
-            if self._is_cache_valid(cache_key):
-                return self.doc_cache[cache_key]["content"]
+            topic = self._infer_topic(event_data)
+            cache_key = (library, topic)
+            entry = self.doc_cache.get(cache_key)
+            if entry and entry["expires_at"] > time.monotonic():
+                self.doc_cache.move_to_end(cache_key)
+                return entry["content"]
                 
             # Resolve library ID
             lib_id = self._resolve_library_id(library)
@@ -367,17 +536,10 @@ class Context7DocsHook(BaseHook):
                 return None
                 
             # Get documentation with topic filtering
-            topic = self._infer_topic(event_data)
             docs = self._fetch_library_docs(lib_id, topic)
             
             if docs:
-                # Cache the result
-                import time
-                self.doc_cache[cache_key] = {
-                    "content": docs,
-                    "timestamp": time.time()
-                }
-                return docs
+                return self._cache_docs(cache_key, docs)
                 
             return None
             
@@ -391,31 +553,8 @@ class Context7DocsHook(BaseHook):
         logger = get_unified_logger()
         
         try:
-            mcp_request = {
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "params": {
-                    "name": "resolve-library-id",
-                    "arguments": {"libraryName": library}
-                },
-                "id": 1
-            }
-            
-            response = self._call_mcp_server(mcp_request)
-            if response and "result" in response:
-                # The result contains content with library information
-                content = response["result"].get("content")
-                if content and isinstance(content, list) and len(content) > 0:
-                    # Parse the response to extract the best library ID
-                    text = content[0].get("text", "")
-                    resolved_id = self._select_best_library_match(text, library)
-                    if resolved_id:
-                        logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                                  f"🔍 Resolved {library} to {resolved_id}")
-                        return resolved_id
-                    
-            # Fallback to library name if resolution fails
-            return library
+            response = self._call_mcp_server(self._build_resolve_request(library))
+            return self._parse_resolved_id(response, library)
             
         except Exception as e:
             logger.log(ComponentType.CONTEXT7, LogLevel.WARNING, 
@@ -427,69 +566,112 @@ class Context7DocsHook(BaseHook):
         logger = get_unified_logger()
         
         try:
-            mcp_request = {
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "params": {
-                    "name": "get-library-docs",
-                    "arguments": {
-                        "context7CompatibleLibraryID": lib_id,
-                        "tokens": self.max_tokens_per_library
-                    }
-                },
-                "id": 1
-            }
-            
-            if topic:
-                mcp_request["params"]["arguments"]["topic"] = topic
-                
-            response = self._call_mcp_server(mcp_request)
-            if response and "result" in response:
-                # The result contains content with documentation
-                content = response["result"].get("content")
-                if content and isinstance(content, list) and len(content) > 0:
-                    # Extract text from the content array
-                    docs = content[0].get("text", "")
-                    if docs:
-                        logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                                  f"📖 Fetched documentation for {lib_id} ({len(docs)} chars)")
-                        return docs
-                    
-            return None
+            response = self._call_mcp_server(self._build_docs_request(lib_id, topic))
+            return self._parse_library_docs(response, lib_id)
             
         except Exception as e:
             logger.log(ComponentType.CONTEXT7, LogLevel.WARNING, 
                       f"⚠️ Could not fetch docs for {lib_id}: {e}")
             return None
             
-    def _infer_topic(self, event_data: Dict[str, Any]) -> Optional[str]:
-        """Infer documentation topic from context."""
-        tool_input = event_data.get("tool_input", {})
-        content = tool_input.get("content", "") or tool_input.get("new_string", "")
+    def _build_resolve_request(self, library: str) -> Dict[str, Any]:
+        """Build the resolve-library-id JSON-RPC request."""
+        return {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {
+                "name": "resolve-library-id",
+                "arguments": {"libraryName": library}
+            },
+            "id": 1
+        }
         
-        topic_keywords = {
-            "authentication": ["auth", "login", "token", "session", "passport"],
-            "routing": ["route", "router", "path", "endpoint", "api"],
-            "testing": ["test", "spec", "mock", "jest", "pytest"],
-            "hooks": ["usestate", "useeffect", "usecallback", "usememo"],
-            "components": ["component", "render", "props", "jsx", "tsx"],
-            "database": ["db", "query", "model", "schema", "migration"]
+    def _build_docs_request(self, lib_id: str, topic: Optional[str] = None) -> Dict[str, Any]:
+        """Build the get-library-docs JSON-RPC request."""
+        mcp_request = {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {
+                "name": "get-library-docs",
+                "arguments": {
+                    "context7CompatibleLibraryID": lib_id,
+                    "tokens": self.max_tokens_per_library
+                }
+            },
+            "id": 1
         }
         
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in content.lower() for keyword in keywords):
-                return topic
+        if topic:
+            mcp_request["params"]["arguments"]["topic"] = topic
+            
+        return mcp_request
+        
+    def _response_text(self, response: Optional[Dict[str, Any]]) -> str:
+        """Extract the first text item from an MCP tool call response."""
+        if response and "result" in response:
+            content = response["result"].get("content")
+            if content and isinstance(content, list) and len(content) > 0:
+                return content[0].get("text", "")
+        return ""
+        
+    def _parse_resolved_id(self, response: Optional[Dict[str, Any]], library: str) -> str:
+        """Pick the library ID from a resolve response, falling back to the name."""
+        text = self._response_text(response)
+        if text:
+            # Parse the response to extract the best library ID
+            resolved_id = self._select_best_library_match(text, library)
+            if resolved_id:
+                get_unified_logger().log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
+                                         f"🔍 Resolved {library} to {resolved_id}")
+                return resolved_id
                 
+        # Fallback to library name if resolution fails
+        return library
+        
+    def _parse_library_docs(self, response: Optional[Dict[str, Any]], lib_id: str) -> Optional[str]:
+        """Extract documentation text from a get-library-docs response."""
+        docs = self._response_text(response)
+        if docs:
+            get_unified_logger().log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
+                                     f"📖 Fetched documentation for {lib_id} ({len(docs)} chars)")
+            return docs
         return None
         
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached documentation is still valid."""
-        if cache_key not in self.doc_cache:
-            return False
+    def _infer_topic(self, event_data: Dict[str, Any]) -> Optional[str]:
+        """Infer documentation topic from context."""
+        tool_input = event_data.get("tool_input", {})
+        content = tool_input.get("content", "") or tool_input.get("new_string", "")
+        return _infer_topic_from_content(content)
+        
+    def _cache_docs(self, cache_key: Tuple[str, Optional[str]], docs: str) -> str:
+        """Store documentation, evicting the least recently used entry when full.
+
+        A refresh that returns less documentation than a still-fresh cached
+        entry only extends that entry's lifetime instead of replacing it; an
+        expired entry is always replaced, so the TTL bounds content age.
+
+        Returns:
+            The documentation now held in the cache
+        """
+        now = time.monotonic()
+        expires_at = now + self.cache_duration_hours * 3600
+        score = len(docs)
+        
+        entry = self.doc_cache.get(cache_key)
+        if entry is not None:
+            self.doc_cache.move_to_end(cache_key)
+            if entry["expires_at"] > now and entry["score"] >= score:
+                entry["expires_at"] = expires_at
+                return entry["content"]
+        elif len(self.doc_cache) >= self.cache_max_entries:
+            self.doc_cache.popitem(last=False)
             
-        import time
-        cache_age_hours = (time.time() - self.doc_cache[cache_key]["timestamp"]) / 3600
-        return cache_age_hours < self.cache_duration_hours
+        self.doc_cache[cache_key] = {
+            "content": docs,
+            "expires_at": expires_at,
+            "score": score
+        }
+        return docs
         
     def _format_context_enhancement(self, enhancements: List[str]) -> str:
         """Format context enhancements for display."""
@@ -545,18 +727,18 @@ class Context7DocsHook(BaseHook):
         """Check if this hook should process the event."""
         # Process both PreToolUse and PostToolUse for different scenarios
         event_type = event_data.get("event_type")
-        if event_type not in ["PreToolUse", "PostToolUse"]:
+        if event_type not in _APPLICABLE_EVENTS:
             return False
             
         tool_name = event_data.get("tool_name", "")
         
         # PreToolUse: Enhance context before code operations
         if event_type == "PreToolUse":
-            return tool_name in ["Write", "Edit", "MultiEdit"]
+            return tool_name in _PRE_TOOLS
             
         # PostToolUse: Analyze new dependencies
         if event_type == "PostToolUse":
-            return tool_name in ["Read"] and self._is_dependency_file_path(
+            return tool_name in _POST_TOOLS and self._is_dependency_file_path(
                 event_data.get("tool_input", {}).get("file_path", "")
             )
             
@@ -565,12 +747,12 @@ class Context7DocsHook(BaseHook):
     def is_applicable_pretooluse(self, event_data: Dict[str, Any]) -> bool:
         """Check if PreToolUse event should be processed."""
         tool_name = event_data.get("tool_name", "")
-        return tool_name in ["Write", "Edit", "MultiEdit"]
+        return tool_name in _PRE_TOOLS
         
     def is_applicable_posttooluse(self, event_data: Dict[str, Any]) -> bool:
         """Check if PostToolUse event should be processed."""
         tool_name = event_data.get("tool_name", "")
-        if tool_name != "Read":
+        if tool_name not in _POST_TOOLS:
             return False
             
         file_path = event_data.get("tool_input", {}).get("file_path", "")
@@ -578,45 +760,40 @@ class Context7DocsHook(BaseHook):
         
     def _is_dependency_file_path(self, file_path: str) -> bool:
         """Check if file path indicates a dependency file."""
-        dependency_files = [
-            "package.json", "requirements.txt", "Cargo.toml",
-            "pyproject.toml", "composer.json", "go.mod"
-        ]
-        return any(dep_file in file_path for dep_file in dependency_files)
+        return bool(_DEP_FILE_RE.search(file_path))
         
     def _select_best_library_match(self, text: str, original_library: str) -> Optional[str]:
         """Select the best library match from Context7 response."""
-        import re
-        
         # Split response into entries
         entries = text.split('----------')
         
         best_entry = None
         best_score = 0
+        library_lower = original_library.lower()
         
         for entry in entries:
             if 'Context7-compatible library ID:' not in entry:
                 continue
                 
             # Extract title
-            title_match = re.search(r'Title: ([^\n]+)', entry)
-            title = title_match.group(1).strip() if title_match else ""
+            title_match = _TITLE_RE.search(entry)
+            title = title_match.group(1).strip().lower() if title_match else ""
             
             # Extract trust score
-            score_match = re.search(r'Trust Score: ([\d.]+)', entry)
+            score_match = _TRUST_SCORE_RE.search(entry)
             score = float(score_match.group(1)) if score_match else 0
             
             # Calculate relevance score
             relevance_score = 0
             
             # Exact match gets highest priority
-            if title.lower() == original_library.lower():
+            if title == library_lower:
                 relevance_score = 100 + score
             # Starts with the library name
-            elif title.lower().startswith(original_library.lower()):
+            elif title.startswith(library_lower):
                 relevance_score = 80 + score
             # Contains the library name
-            elif original_library.lower() in title.lower():
+            elif library_lower in title:
                 relevance_score = 60 + score
             else:
                 relevance_score = score
@@ -625,9 +802,13 @@ class Context7DocsHook(BaseHook):
             if relevance_score > best_score:
                 best_score = relevance_score
                 best_entry = entry
+                # An exact match at the top trust score cannot be beaten;
+                # with a lower score a later exact match still could
+                if best_score >= 100 + MAX_TRUST_SCORE:
+                    break
         
         if best_entry:
-            lib_id_match = re.search(r'Context7-compatible library ID: ([^\n]+)', best_entry)
+            lib_id_match = _LIBRARY_ID_RE.search(best_entry)
             return lib_id_match.group(1).strip() if lib_id_match else None
         
         return None
@@ -635,10 +816,11 @@ class Context7DocsHook(BaseHook):
     def _call_mcp_server(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Call Context7 MCP server with JSON-RPC request."""
         logger = get_unified_logger()
+        response: Optional[requests.Response] = None
         
         try:
-            tool_info = self.external_loader.get_tool_info("context7")
-            if not tool_info or not tool_info.get("available"):
+            tool_info = self._tool_info
+            if not self._context7_available:
                 logger.log(ComponentType.CONTEXT7, LogLevel.WARNING, 
                           "⚠️ Context7 MCP server not available")
                 return None
@@ -656,17 +838,15 @@ class Context7DocsHook(BaseHook):
                     
                 logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
                           f"🌐 Calling Context7 MCP via HTTP: {url}")
+                # Serialize once; the same body is logged and sent
+                body = json.dumps(request)
                 logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                          f"📤 Request: {json.dumps(request)[:200]}...")
+                          f"📤 Request: {body[:200]}...")
                 
-                import requests
-                response = requests.post(
+                response = self._http.post(
                     url,
-                    json=request,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json, text/event-stream"
-                    },
+                    data=body,
+                    headers=_MCP_HTTP_HEADERS,
                     timeout=TIMEOUTS.for_mcp_server()
                 )
                 
@@ -675,10 +855,10 @@ class Context7DocsHook(BaseHook):
                               f"❌ Context7 HTTP error: {response.status_code} - {response.text[:200]}...")
                     return None
                     
-                result = response.json()
+                # Log the raw body rather than re-serializing the parsed result
                 logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                          f"📥 HTTP response: {json.dumps(result, indent=2)[:200]}...")
-                return result
+                          f"📥 HTTP response: {response.text[:200]}...")
+                return response.json()
                 
             else:
                 # Use stdio transport (local server) with proper MCP initialization
@@ -696,93 +876,35 @@ class Context7DocsHook(BaseHook):
                 logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
                           f"🔧 Calling Context7 MCP: {' '.join(full_command)}")
                 
-                # Start MCP server process
-                import subprocess
-                process = subprocess.Popen(
-                    full_command,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                
-                try:
-                    # Step 1: Initialize the MCP server
-                    init_request = {
-                        "jsonrpc": "2.0",
-                        "method": "initialize",
-                        "params": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {
-                                "roots": {"listChanged": True},
-                                "sampling": {}
-                            },
-                            "clientInfo": {
-                                "name": "claude-buddy",
-                                "version": "1.0.0"
-                            }
-                        },
-                        "id": 0
-                    }
-                    
-                    logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                              f"📤 Sending initialize: {json.dumps(init_request)[:200]}...")
-                    process.stdin.write(json.dumps(init_request) + "\n")
-                    process.stdin.flush()
-                    
-                    # Read initialization response
-                    init_response = process.stdout.readline()
-                    logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                              f"📥 Init response: {init_response[:200]}...")
-                    
-                    # Step 2: Send initialized notification
-                    initialized_notification = {
-                        "jsonrpc": "2.0",
-                        "method": "notifications/initialized",
-                        "params": {}
-                    }
-                    
-                    logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                              f"📤 Sending initialized: {json.dumps(initialized_notification)}")
-                    process.stdin.write(json.dumps(initialized_notification) + "\n")
-                    process.stdin.flush()
-                    
-                    # Step 3: Send the actual tool request
-                    logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                              f"📤 Sending request: {json.dumps(request)[:200]}...")
-                    process.stdin.write(json.dumps(request) + "\n")
-                    process.stdin.flush()
-                    
-                    # Read tool response
-                    tool_response = process.stdout.readline()
-                    logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                              f"📥 Tool response: {tool_response[:200]}...")
-                    
-                    # Close the process
-                    process.stdin.close()
-                    process.wait(timeout=TIMEOUTS.for_mcp_server())
-                    
-                    if tool_response:
-                        response = json.loads(tool_response)
-                        logger.log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
-                                  f"📋 Parsed response: {json.dumps(response, indent=2)[:200]}...")
-                        return response
+                # Reuse the running server; restart it once if it went away
+                error: Optional[Exception] = None
+                for _ in range(2):
+                    try:
+                        return self._mcp_roundtrip(full_command, request)
+                    except (BrokenPipeError, EOFError) as e:
+                        self._stop_mcp_process(graceful=False)
+                        error = e
+                    except subprocess.TimeoutExpired:
+                        # A hung server is killed rather than waited on again
+                        self._stop_mcp_process(graceful=False)
+                        raise
+                    except Exception as e:
+                        self._stop_mcp_process(graceful=False)
+                        logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
+                                  f"❌ Error in MCP communication: {e}")
+                        return None
                         
-                    return None
-                    
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    process.wait()
-                    logger.log(ComponentType.CONTEXT7, LogLevel.WARNING, 
-                              "⏱️ Context7 MCP server request timed out (subprocess)")
-                    return None
-                except Exception as e:
-                    process.kill()
-                    process.wait()
-                    logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
-                              f"❌ Error in MCP communication: {e}")
-                    return None
+                logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
+                          f"❌ Context7 MCP server exited: {error}")
+                return None
             
+        except json.JSONDecodeError as e:
+            # Checked before RequestException: requests' decode error subclasses both
+            logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
+                      f"❌ Invalid JSON response from Context7 MCP server: {e}")
+            logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
+                      f"📄 Raw response: {response.text[:500] if response is not None else 'N/A'}")
+            return None
         except requests.RequestException as e:
             logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
                       f"❌ Context7 HTTP request error: {e}")
@@ -791,17 +913,148 @@ class Context7DocsHook(BaseHook):
             logger.log(ComponentType.CONTEXT7, LogLevel.WARNING, 
                       "⏱️ Context7 MCP server request timed out")
             return None
-        except json.JSONDecodeError as e:
-            logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
-                      f"❌ Invalid JSON response from Context7 MCP server: {e}")
-            logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
-                      f"📄 Raw response: {response.text if 'response' in locals() else result.stdout if 'result' in locals() else 'N/A'}")
-            return None
         except Exception as e:
             logger.log(ComponentType.CONTEXT7, LogLevel.ERROR, 
                       f"❌ Error calling Context7 MCP server: {e}")
             return None
             
+    def _ensure_mcp_process(self, full_command: List[str]) -> subprocess.Popen:
+        """Return the running stdio MCP server, starting and initializing it if needed."""
+        logger = get_unified_logger()
+        
+        process = self._mcp_process
+        if process is not None and process.poll() is None:
+            return process
+        self._stop_mcp_process(graceful=False)
+        
+        # stderr is discarded: an unread pipe would fill up and stall the server
+        process = subprocess.Popen(
+            full_command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self._mcp_process = process
+        self._mcp_finalizer = weakref.finalize(self, _shutdown_mcp_process, process)
+        self._mcp_selector = selectors.DefaultSelector()
+        self._mcp_selector.register(process.stdout, selectors.EVENT_READ)
+        self._mcp_buffer.clear()
+        
+        # Step 1: Initialize the MCP server
+        init_request = {
+            "jsonrpc": "2.0",
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {
+                    "roots": {"listChanged": True},
+                    "sampling": {}
+                },
+                "clientInfo": {
+                    "name": "claude-buddy",
+                    "version": "1.0.0"
+                }
+            },
+            "id": 0
+        }
+        self._write_mcp_message(process, init_request)
+        self._read_mcp_message(process, 0)
+        
+        # Step 2: Send initialized notification
+        self._write_mcp_message(process, {
+            "jsonrpc": "2.0",
+            "method": "notifications/initialized",
+            "params": {}
+        })
+        return process
+        
+    def _mcp_roundtrip(self, full_command: List[str], request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request to the stdio MCP server and wait for its response."""
+        process = self._ensure_mcp_process(full_command)
+        request = {**request, "id": next(self._mcp_ids)}
+        self._write_mcp_message(process, request)
+        return self._read_mcp_message(process, request["id"])
+        
+    def _write_mcp_message(self, process: subprocess.Popen, message: Any) -> None:
+        """Write one newline-delimited JSON-RPC message to the server."""
+        line = json.dumps(message)
+        get_unified_logger().log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
+                                 f"📤 Sending: {line[:200]}...")
+        process.stdin.write(line.encode("utf-8") + b"\n")
+        process.stdin.flush()
+        
+    def _read_mcp_message(self, process: subprocess.Popen, message_id: int) -> Dict[str, Any]:
+        """Read messages until the response with the given id arrives.
+
+        Server notifications, unrelated messages and lines that are not
+        JSON (such as log output from npx) in between are skipped.
+
+        Raises:
+            EOFError: If the server closed its output
+            subprocess.TimeoutExpired: If the response did not arrive in time
+        """
+        deadline = time.monotonic() + TIMEOUTS.for_mcp_server()
+        while True:
+            line = self._read_mcp_line(process, deadline)
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(message, dict) and message.get("id") == message_id:
+                get_unified_logger().log(ComponentType.CONTEXT7, LogLevel.DEBUG, 
+                                         f"📥 Response: {line[:200].decode('utf-8', 'replace')}...")
+                return message
+                
+    def _read_mcp_line(self, process: subprocess.Popen, deadline: float) -> bytes:
+        """Read one line of server output, giving up at a monotonic deadline.
+
+        Unlike readline(), a server that stops responding cannot block the
+        hook past the MCP timeout.
+
+        Raises:
+            EOFError: If the server closed its output
+            subprocess.TimeoutExpired: If no complete line arrived in time
+        """
+        buffer = self._mcp_buffer
+        while True:
+            # Checked before buffered lines too, so a server flooding output
+            # cannot keep the caller past its deadline
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(process.args, TIMEOUTS.for_mcp_server())
+                
+            newline = buffer.find(b"\n")
+            if newline >= 0:
+                line = bytes(buffer[:newline + 1])
+                del buffer[:newline + 1]
+                return line
+                
+            if not self._mcp_selector.select(remaining):
+                raise subprocess.TimeoutExpired(process.args, TIMEOUTS.for_mcp_server())
+            chunk = os.read(process.stdout.fileno(), 65536)
+            if not chunk:
+                raise EOFError("Context7 MCP server closed its output")
+            buffer += chunk
+
+    def _stop_mcp_process(self, graceful: bool = True) -> None:
+        """Shut down the stdio MCP server, if one is running."""
+        process, self._mcp_process = self._mcp_process, None
+        if process is None:
+            return
+        if self._mcp_finalizer is not None:
+            self._mcp_finalizer.detach()
+            self._mcp_finalizer = None
+        if self._mcp_selector is not None:
+            self._mcp_selector.close()
+            self._mcp_selector = None
+        self._mcp_buffer.clear()
+        _shutdown_mcp_process(process, graceful)
+        
+    def cleanup(self) -> None:
+        """Terminate the MCP server subprocess and close pooled connections."""
+        self._stop_mcp_process()
+        self._http.close()
+            
     def get_config_schema(self) -> Dict[str, Any]:
         """Return configuration schema."""
         schema = super().get_config_schema()
@@ -832,6 +1085,15 @@ class Context7DocsHook(BaseHook):
                 "minimum": 1,
                 "maximum": 168
             },
+            "cache_max_entries": {
+                "type": "integer",
+                "description": (
+                    "Maximum number of documentation entries one hook instance keeps "
+                    "in memory; only matters when a hook is reused within a process"
+                ),
+                "default": 256,
+                "minimum": 1
+            },
             "priority_libraries": {
                 "type": "array",
                 "items": {"type": "string"},
@@ -26,6 +26,7 @@ class HookManager:
         self.registry_path = registry_path or (Path(__file__).parent / "registry.json")
         self.registry_data: Dict[str, Any] = {}
         self.loaded_modules: Dict[str, Any] = {}
+        self.module_mtimes: Dict[str, int] = {}
         self._load_registry()
 
     def _load_registry(self) -> None:
@@ -141,16 +142,25 @@ class HookManager:
             return None
 
     def _load_module(self, name: str, path: Path) -> Any:
-        """Load a Python module from file."""
-        # Check cache
-        cache_key = str(path)
-        if cache_key in self.loaded_modules:
-            return self.loaded_modules[cache_key]
+        """Load a Python module from file.
 
-        if not path.exists():
+        Modules are cached per file modification time, so an edited hook
+        file is imported again on its next load.
+        """
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
             logger.error(f"Module path does not exist: {path}")
             return None
 
+        # Check cache
+        cache_key = str(path)
+        if (
+            cache_key in self.loaded_modules
+            and self.module_mtimes.get(cache_key) == mtime_ns
+        ):
+            return self.loaded_modules[cache_key]
+
         try:
             spec = importlib.util.spec_from_file_location(name, str(path))
             if not spec or not spec.loader:
@@ -162,6 +172,7 @@ class HookManager:
 
             # Cache the module
             self.loaded_modules[cache_key] = module
+            self.module_mtimes[cache_key] = mtime_ns
             return module
 
         except Exception as e:
@@ -212,7 +223,17 @@ class HookManager:
         return None
 
     def _find_hook_class(self, module: Any) -> Optional[Type[ClaudeHook]]:
-        """Find a hook class in a module."""
+        """Find a hook class in a module.
+
+        A class marked with ``register_hook`` or named by a module-level
+        ``HOOK_CLASS`` is used directly; otherwise the module is scanned.
+        """
+        declared = getattr(module, "__claude_hook__", None) or getattr(
+            module, "HOOK_CLASS", None
+        )
+        if isinstance(declared, type):
+            return declared
+
         excluded_names = ["BaseHook", "ClaudeHook", "ExternalHookAdapter"]
 
         for attr_name in dir(module):
@@ -264,6 +285,7 @@ class HookManager:
     def reload_registry(self) -> None:
         """Reload the registry from disk."""
         self.loaded_modules.clear()
+        self.module_mtimes.clear()
         self._load_registry()
 
 
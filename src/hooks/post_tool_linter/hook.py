@@ -4,16 +4,22 @@
 This hook automatically fixes linting and type issues in Python files
 after they are modified by Claude Code tools.
 """
+import fcntl
+import hashlib
 import json
 import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from subprocess import CompletedProcess
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -104,6 +110,16 @@ CLAUDE_PATH: str = _find_claude_path()
 
 DEBUG_LOG = "/tmp/post_tool_linter_debug.log"
 
+LINT_CACHE_DIR = Path(__file__).parent / "cache"
+LINT_CACHE_TTL_SECONDS = 24 * 3600
+LINT_CACHE_MAX_ENTRIES = 2000
+# Bumped whenever the key derivation changes, so older index entries miss
+LINT_CACHE_VERSION = "2"
+
+# Type checkers follow imports, so their verdict depends on other files and
+# is never cached; the remaining linters only look at the file itself
+_UNCACHED_LINTERS = frozenset(("mypy", "pyright"))
+
 
 def _find_project_root(file_path: str) -> str:
     """Find the project root directory (containing .git or pyproject.toml)."""
@@ -409,6 +425,205 @@ def _run_pyright_linter(
     return True, ""
 
 
+@contextmanager
+def _lint_cache_lock() -> Iterator[None]:
+    """Hold an exclusive lock on the cache directory's sidecar lock file."""
+    LINT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LINT_CACHE_DIR / ".lock", "w", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _stat_stamp(st: os.stat_result) -> str:
+    """Format the cheap change-detection stamp for a stat result."""
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_lint_index() -> Dict[str, Any]:
+    """Load the path -> (stamp, key) index used by the fast cache tier."""
+    try:
+        with open(LINT_CACHE_DIR / "index.json", "r", encoding="utf-8") as f:
+            data: Any = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cast(Dict[str, Any], data) if isinstance(data, dict) else {}
+
+
+def _atomic_write_json(target: Path, data: Any) -> None:  # type: ignore[ANN401]
+    """Write JSON to target via a temp file so readers never see partial data."""
+    tmp_file = target.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_file, target)
+
+
+def _lint_cache_key(
+    file_path: str, enabled_linters: List[str], config_paths: List[str]
+) -> Optional[str]:
+    """Build a cache key from the file and everything that affects linting.
+
+    The absolute path is part of the key: linter config can differ per file
+    (flake8 per-file-ignores) and the cached messages name the file.
+
+    Two tiers: if the file and config stats (mtime, size) match the index,
+    the previously computed key is reused without reading anything. Otherwise
+    the content is hashed from the same file descriptor that was stat'ed and
+    the index is updated.
+
+    Args:
+        file_path: Path to the file being linted
+        enabled_linters: Names of the linters that will run
+        config_paths: Linter configuration files whose content affects results
+
+    Returns:
+        Hex digest key, or None if the file cannot be read
+    """
+    abs_path = os.path.abspath(file_path)
+    config_stamps: List[str] = []
+    for config_path in config_paths:
+        try:
+            config_stamps.append(_stat_stamp(os.stat(config_path)))
+        except OSError:
+            config_stamps.append("-")
+    context = "|".join(
+        [LINT_CACHE_VERSION, sys.version, ",".join(enabled_linters)] + config_stamps
+    )
+
+    # Fast tier: stat only
+    try:
+        stamp = f"{_stat_stamp(os.stat(abs_path))}|{context}"
+    except OSError:
+        return None
+    indexed = _read_lint_index().get(abs_path)
+    if isinstance(indexed, dict):
+        typed_indexed = cast(Dict[str, Any], indexed)
+        indexed_key = typed_indexed.get("key")
+        if typed_indexed.get("stamp") == stamp and isinstance(indexed_key, str):
+            return indexed_key
+
+    # Slow tier: hash the content
+    try:
+        with open(abs_path, "rb") as f:
+            stamp = f"{_stat_stamp(os.fstat(f.fileno()))}|{context}"
+            source = f.read()
+    except OSError:
+        return None
+
+    digest = hashlib.blake2b(source, digest_size=16)
+    digest.update(LINT_CACHE_VERSION.encode("utf-8"))
+    digest.update(abs_path.encode("utf-8"))
+    digest.update(sys.version.encode("utf-8"))
+    digest.update(",".join(enabled_linters).encode("utf-8"))
+    for config_path in config_paths:
+        try:
+            with open(config_path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"-")
+    cache_key = digest.hexdigest()
+
+    try:
+        with _lint_cache_lock():
+            index = _read_lint_index()
+            index[abs_path] = {"stamp": stamp, "key": cache_key}
+            _atomic_write_json(LINT_CACHE_DIR / "index.json", index)
+    except OSError:
+        pass
+    return cache_key
+
+
+def _read_lint_cache(cache_key: str) -> Optional[Dict[str, Tuple[bool, str]]]:
+    """Return cached per-linter results for the key, if they exist and are fresh."""
+    cache_file = LINT_CACHE_DIR / f"{cache_key}.json"
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            entry: Any = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(entry, dict):
+        return None
+    typed_entry = cast(Dict[str, Any], entry)
+    timestamp = typed_entry.get("timestamp")
+    if not isinstance(timestamp, (int, float)):
+        return None
+    if time.time() - timestamp > LINT_CACHE_TTL_SECONDS:
+        return None
+    results = typed_entry.get("results")
+    if not isinstance(results, dict):
+        return None
+    parsed: Dict[str, Tuple[bool, str]] = {}
+    for name, result in cast(Dict[str, Any], results).items():
+        if not isinstance(result, list) or len(cast(List[Any], result)) != 2:
+            return None
+        passed, issue = cast(List[Any], result)
+        if not isinstance(passed, bool) or not isinstance(issue, str):
+            return None
+        parsed[name] = (passed, issue)
+    return parsed
+
+
+def _evict_lint_cache() -> None:
+    """Drop the oldest result entries once the cache exceeds its size cap.
+
+    The fast-tier index is pruned alongside: entries whose result file is
+    gone or whose linted file no longer exists are removed, so the index
+    stays bounded by the number of cached results. Must be called with the
+    cache lock held.
+    """
+    entries = [
+        entry for entry in LINT_CACHE_DIR.glob("*.json") if entry.name != "index.json"
+    ]
+    excess = len(entries) - LINT_CACHE_MAX_ENTRIES
+    if excess > 0:
+
+        def _mtime(entry: Path) -> float:
+            try:
+                return entry.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        entries.sort(key=_mtime)
+        for entry in entries[:excess]:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+        entries = entries[excess:]
+
+    live_keys = {entry.stem for entry in entries}
+    index = _read_lint_index()
+    pruned = {
+        path: indexed
+        for path, indexed in index.items()
+        if isinstance(indexed, dict)
+        and cast(Dict[str, Any], indexed).get("key") in live_keys
+        and os.path.exists(path)
+    }
+    if len(pruned) != len(index):
+        _atomic_write_json(LINT_CACHE_DIR / "index.json", pruned)
+
+
+def _write_lint_cache(cache_key: str, results: Dict[str, Tuple[bool, str]]) -> None:
+    """Store per-linter results under the key (best effort)."""
+    try:
+        with _lint_cache_lock():
+            _atomic_write_json(
+                LINT_CACHE_DIR / f"{cache_key}.json",
+                {
+                    "results": {name: list(result) for name, result in results.items()},
+                    "timestamp": time.time(),
+                },
+            )
+            _evict_lint_cache()
+    except OSError:
+        # Caching is an optimization; never fail linting because of it
+        pass
+
+
 def run_linters(file_path: str) -> Tuple[bool, str]:
     """Run linters on file and return pass status and issues.
 
@@ -420,21 +635,25 @@ def run_linters(file_path: str) -> Tuple[bool, str]:
     - hooks/post_tool_linter/pyproject.toml for black, isort, mypy
     - hooks/post_tool_linter/.flake8 for flake8
     - hooks/post_tool_linter/pyrightconfig.json for pyright
+
+    Linters run concurrently. Results of the file-local linters (black,
+    isort, flake8) are cached on disk keyed by file path and content, Python
+    version, those linters and their configuration, so re-linting an unchanged file
+    skips them. Type checkers (mypy, pyright) always run, because their
+    results also depend on the modules the file imports.
     """
     issues: List[str] = []
     all_pass = True
 
     # Load config to get enabled linters
     config = _load_hook_config()
-    enabled_linters = config.get("settings", {}).get(
-        "enabled_linters", ["black", "flake8", "pyright"]
-    )
+    settings = config.get("settings", {})
+    enabled_linters = settings.get("enabled_linters", ["black", "flake8", "pyright"])
 
     # Get configuration file paths
     pyproject_path, flake8_config, hook_dir = _get_linter_config_paths(file_path)
     project_root = _find_project_root(file_path)
 
-    # Run each enabled linter
     linter_runners: Dict[str, Callable[[], Tuple[bool, str]]] = {
         "black": lambda: _run_black_linter(file_path, pyproject_path),
         "isort": lambda: _run_isort_linter(file_path, pyproject_path),
@@ -442,14 +661,39 @@ def run_linters(file_path: str) -> Tuple[bool, str]:
         "mypy": lambda: _run_mypy_linter(file_path, pyproject_path),
         "pyright": lambda: _run_pyright_linter(file_path, project_root, hook_dir),
     }
+    selected = [name for name in enabled_linters if name in linter_runners]
+    cacheable = [name for name in selected if name not in _UNCACHED_LINTERS]
+
+    # Serve the file-local linters' results for unchanged files from the cache
+    cache_key: Optional[str] = None
+    results: Dict[str, Tuple[bool, str]] = {}
+    if settings.get("cache_results", True) and cacheable:
+        cache_key = _lint_cache_key(
+            file_path, cacheable, [pyproject_path, flake8_config]
+        )
+        if cache_key:
+            cached = _read_lint_cache(cache_key)
+            if cached is not None and set(cached) == set(cacheable):
+                results.update(cached)
+
+    # Every linter runs in check-only mode, so they are independent subprocesses
+    # and can run side by side; results are collected in configured order.
+    pending = [name for name in selected if name not in results]
+    if len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {name: executor.submit(linter_runners[name]) for name in pending}
+            results.update((name, future.result()) for name, future in futures.items())
+    else:
+        results.update((name, linter_runners[name]()) for name in pending)
 
-    for linter_name in enabled_linters:
-        if linter_name in linter_runners:
-            passed, issue = linter_runners[linter_name]()
-            if not passed:
-                all_pass = False
-                issues.append(issue)
+    for name in selected:
+        passed, issue = results[name]
+        if not passed:
+            all_pass = False
+            issues.append(issue)
 
+    if cache_key and any(name in pending for name in cacheable):
+        _write_lint_cache(cache_key, {name: results[name] for name in cacheable})
     return all_pass, "\n\n".join(issues)
 
 
@@ -964,6 +1208,8 @@ class PostToolLinterHook(BaseHook):
     ) -> None:
         """Initialize hook with configuration and concurrency manager."""
         super().__init__(config, concurrency_manager)
+        # Resolve per-event options once instead of on every event
+        self.auto_fix = config.get("settings", {}).get("auto_fix", True)
         # If no concurrency manager provided, try to get the global one
         if self.concurrency_manager is None:
             try:
@@ -1042,7 +1288,7 @@ class PostToolLinterHook(BaseHook):
             return True, f"✅ {os.path.basename(file_path)} - No linting issues found"
 
         # Only run autofix if enabled
-        if self.config.get("settings", {}).get("auto_fix", True):
+        if self.auto_fix:
             logger.log(ComponentType.POST_TOOL_LINTER, LogLevel.INFO, 
                       f"🔧 Starting auto-fix process for: {file_path}")
             
@@ -1139,6 +1385,11 @@ class PostToolLinterHook(BaseHook):
                             "maximum": 10,
                             "description": "Maximum autofix attempts",
                         },
+                        "cache_results": {
+                            "type": "boolean",
+                            "default": True,
+                            "description": "Reuse black, isort and flake8 results for unchanged files",
+                        },
                     },
                 }
             }
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Post-Tool Linter result cache keyed by file path and content.
+
+flake8 is replaced on PATH by a small script that, like the repo's
+per-file-ignores for ``__init__.py: F401``, only reports the unused import
+outside ``__init__.py`` and logs every invocation, so cache hits and
+misses can be observed from the linter's side.
+"""
+
+import json
+import os
+import sys
+import textwrap
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from hooks.post_tool_linter import hook as linter_hook  # noqa: E402
+
+FAKE_FLAKE8 = textwrap.dedent(
+    '''\
+    #!{python}
+    import os
+    import sys
+
+    path = sys.argv[1]
+    with open(os.environ["FAKE_FLAKE8_LOG"], "a") as log:
+        log.write(os.path.basename(path) + "\\n")
+    with open(path) as f:
+        source = f.read()
+    if "import os" in source and os.path.basename(path) != "__init__.py":
+        print(f"{{path}}:1:1: F401 'os' imported but unused")
+        sys.exit(1)
+    '''
+)
+
+SOURCE = "import os\n"
+
+
+@pytest.fixture
+def flake8_runs(tmp_path, monkeypatch):
+    """Put the fake flake8 first on PATH and return its invocation log reader."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "flake8"
+    script.write_text(FAKE_FLAKE8.format(python=sys.executable))
+    script.chmod(0o755)
+    log_path = tmp_path / "flake8.log"
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_FLAKE8_LOG", str(log_path))
+    monkeypatch.setattr(linter_hook, "LINT_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(
+        linter_hook,
+        "_load_hook_config",
+        lambda: {"settings": {"enabled_linters": ["flake8"]}},
+    )
+
+    def runs() -> List[str]:
+        return log_path.read_text().split() if log_path.exists() else []
+
+    return runs
+
+
+def test_identical_files_get_distinct_keys(tmp_path):
+    """The key covers the path, not just the bytes."""
+    package = tmp_path / "pkg"
+    package.mkdir()
+    init_file = package / "__init__.py"
+    module_file = package / "mod.py"
+    init_file.write_text(SOURCE)
+    module_file.write_text(SOURCE)
+
+    init_key = linter_hook._lint_cache_key(str(init_file), ["flake8"], [])
+    module_key = linter_hook._lint_cache_key(str(module_file), ["flake8"], [])
+
+    assert init_key and module_key
+    assert init_key != module_key
+
+
+def test_results_do_not_leak_between_identical_files(tmp_path, flake8_runs):
+    """A clean __init__.py verdict is not reused for mod.py, and vice versa."""
+    package = tmp_path / "pkg"
+    package.mkdir()
+    init_file = package / "__init__.py"
+    module_file = package / "mod.py"
+    init_file.write_text(SOURCE)
+    module_file.write_text(SOURCE)
+
+    assert linter_hook.run_linters(str(init_file)) == (True, "")
+    passed, issues = linter_hook.run_linters(str(module_file))
+    assert not passed
+    assert str(module_file) in issues
+    assert flake8_runs() == ["__init__.py", "mod.py"]
+
+    # Second round is served from the cache with each file's own verdict
+    assert linter_hook.run_linters(str(init_file)) == (True, "")
+    assert linter_hook.run_linters(str(module_file)) == (passed, issues)
+    assert flake8_runs() == ["__init__.py", "mod.py"]
+
+
+def test_edited_file_is_linted_again(tmp_path, flake8_runs):
+    """Changing the content misses the cache."""
+    module_file = tmp_path / "mod.py"
+    module_file.write_text(SOURCE)
+    assert not linter_hook.run_linters(str(module_file))[0]
+
+    module_file.write_text("x = 1\n")
+    assert linter_hook.run_linters(str(module_file)) == (True, "")
+    assert flake8_runs() == ["mod.py", "mod.py"]
+
+
+def test_eviction_prunes_the_index(tmp_path, flake8_runs, monkeypatch):
+    """Index entries go with their evicted results and with deleted files."""
+    monkeypatch.setattr(linter_hook, "LINT_CACHE_MAX_ENTRIES", 2)
+    cache_dir = tmp_path / "cache"
+    files = []
+    for i in range(4):
+        path = tmp_path / f"mod{i}.py"
+        path.write_text(f"x = {i}\n")
+        files.append(path)
+        before = set(cache_dir.glob("*.json"))
+        linter_hook.run_linters(str(path))
+        # Spread result mtimes so eviction order is the write order
+        for entry in set(cache_dir.glob("*.json")) - before:
+            if entry.name != "index.json":
+                os.utime(entry, (i + 1, i + 1))
+
+    index_file = cache_dir / "index.json"
+    index = json.loads(index_file.read_text())
+    assert sorted(Path(p).name for p in index) == ["mod2.py", "mod3.py"]
+
+    files[3].unlink()
+    survivor = tmp_path / "mod4.py"
+    survivor.write_text("x = 4\n")
+    linter_hook.run_linters(str(survivor))
+
+    index = json.loads(index_file.read_text())
+    assert "mod3.py" not in {Path(p).name for p in index}
+    assert str(survivor.resolve()) in {os.path.realpath(p) for p in index}
@@ -198,33 +198,46 @@ class GlobalConcurrencyManager:
             # Process doesn't exist
             return True
 
-    def _cleanup_stale_locks(self: "GlobalConcurrencyManager", pool_name: str) -> None:
-        """Remove stale lock files for a resource pool."""
+    def _cleanup_stale_locks(self: "GlobalConcurrencyManager", pool_name: str) -> int:
+        """Remove stale lock files for a resource pool.
+
+        Returns:
+            Number of lock files left in the pool, counted in the same scan
+        """
         # Ensure pool subdirectory exists
         pool_dir = self.lock_dir / pool_name
         pool_dir.mkdir(parents=True, exist_ok=True)
         
+        remaining = 0
         pattern = "*.json"
         for lock_file in pool_dir.glob(pattern):
-            if self._is_lock_stale(lock_file):
-                self._remove_stale_lock(lock_file)
+            if not self._is_lock_stale(lock_file) or not self._remove_stale_lock(
+                lock_file
+            ):
+                remaining += 1
+        return remaining
 
-    def _remove_stale_lock(self: "GlobalConcurrencyManager", lock_file: Path) -> None:
-        """Remove a single stale lock file."""
+    def _remove_stale_lock(self: "GlobalConcurrencyManager", lock_file: Path) -> bool:
+        """Remove a single stale lock file.
+
+        Returns:
+            True if the file was removed, False if it is still there
+        """
         try:
             lock_file.unlink()
             self._debug_log(f"Removed stale lock: {lock_file}")
+            return True
+        except FileNotFoundError:
+            # Already removed by another process
+            return True
         except OSError as e:
             msg = f"Failed to remove stale lock {lock_file}: {e}"
             self._debug_log(msg)
+            return False
 
     def _count_active_locks(self: "GlobalConcurrencyManager", pool_name: str) -> int:
         """Count non-stale locks for a resource pool."""
-        self._cleanup_stale_locks(pool_name)
-        pool_dir = self.lock_dir / pool_name
-        if not pool_dir.exists():
-            return 0
-        return len(list(pool_dir.glob("*.json")))
+        return self._cleanup_stale_locks(pool_name)
 
     def _try_acquire_lock_atomically(
         self: "GlobalConcurrencyManager",
@@ -311,12 +324,9 @@ class GlobalConcurrencyManager:
         Returns:
             Path to created lock file or None if at capacity
         """
-        # Clean up stale locks and check count
-        self._cleanup_stale_locks(pool_name)
+        # Clean up stale locks and check count in a single directory scan
+        current_count = self._cleanup_stale_locks(pool_name)
         pool_dir = self.lock_dir / pool_name
-        pool_dir.mkdir(parents=True, exist_ok=True)
-        
-        current_count = len(list(pool_dir.glob("*.json")))
         if current_count >= max_resources:
             self._debug_log(
                 f"Pool {pool_name} at capacity " f"({current_count}/{max_resources})",
@@ -474,8 +484,8 @@ class GlobalConcurrencyManager:
         Returns:
             Path to lock file if successful, None otherwise
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             lock_file = self._try_acquire_lock_atomically(
                 pool_name,
                 max_resources,